@@ -4,7 +4,6 @@ import os
 import shutil
 import zipfile
 import io
-from PIL import Image
 
 
 class MarkdownToHtml:
@@ -264,7 +263,13 @@ class MarkdownToHtml:
     def _handle_image(self, content):
         # content = [attr, caption, [target, title]]
         attr = content[0]
-        attr_dict = dict(attr[2]) if attr and len(attr) > 2 else {}
+        width_attr = height_attr = None
+        if attr and len(attr) > 2:
+            for key, val in attr[2]:
+                if key == 'width':
+                    width_attr = val
+                elif key == 'height':
+                    height_attr = val
 
         alt_text = self._process_inlines(content[1])
         src_path = content[2][0]
@@ -305,16 +310,17 @@ class MarkdownToHtml:
 
             return int(val)
 
-        if 'width' in attr_dict:
-            w_int = parse_to_px(attr_dict['width'])
+        if width_attr is not None:
+            w_int = parse_to_px(width_attr)
 
-        if 'height' in attr_dict:
-            h_int = parse_to_px(attr_dict['height'])
+        if height_attr is not None:
+            h_int = parse_to_px(height_attr)
 
         # Pillow Auto-Sizing
         if w_int is None:
              try:
                  if os.path.exists(src_path):
+                     from PIL import Image
                      with Image.open(src_path) as im:
                          w_int, h_int = im.size
              except:
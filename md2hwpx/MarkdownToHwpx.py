@@ -1,4 +1,5 @@
 import copy
+import functools
 import random
 import re
 import sys
@@ -11,7 +12,6 @@ import json
 import logging
 import xml.sax.saxutils as saxutils
 import xml.etree.ElementTree as ET
-from PIL import Image
 import base64
 import urllib.request
 import tempfile
@@ -27,6 +27,26 @@ NS_PARA = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
 NS_CORE = 'http://www.hancom.co.kr/hwpml/2011/core'
 NS_SEC = 'http://www.hancom.co.kr/hwpml/2011/section'
 
+# Clark-notation tags used when cloning paraPr nodes for auto-numbered lists
+_HH_HEADING = f'{{{NS_HEAD}}}heading'
+_HC_LEFT = f'{{{NS_CORE}}}left'
+_HC_INTENT = f'{{{NS_CORE}}}intent'
+
+
+# Cached bytes stay alive for the process (e.g. the web server), so keep few:
+# at most 2 x MAX_TEMPLATE_FILE_SIZE. The built-in blank.hwpx is ~8 KB.
+@functools.lru_cache(maxsize=2)
+def _read_template_file(path, mtime_ns, size):
+    """Read template bytes; cache key includes mtime/size so edits are picked up."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _load_template_bytes(path):
+    """Return raw bytes of a reference HWPX, reusing them across conversions."""
+    st = os.stat(path)
+    return _read_template_file(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
 
 class MarkdownToHwpx:
     # Placeholder patterns (compiled once at class level)
@@ -64,6 +84,17 @@ class MarkdownToHwpx:
 
         # List placeholder styles (bullet/ordered × levels 1-7)
         self.list_styles = {}
+        # (list_type, level) -> (char_pr_id, para_pr_id, prefix), filled lazily
+        self._resolved_list_styles = {}
+        # Block type -> handler for blocks inside list items (see _walk_list)
+        self._list_block_handlers = {
+            'Para': self._emit_list_para,
+            'Plain': self._emit_list_para,
+            'BulletList': self._emit_list_bullet,
+            'OrderedList': self._emit_list_ordered,
+        }
+        # Normal-style paraPr node cloned for auto-numbered list items
+        self._list_base_para_pr = None
 
         # Header counters for auto-numbering (level -> count)
         self.header_counters = {}
@@ -84,7 +115,17 @@ class MarkdownToHwpx:
         self.char_pr_cache = {}
         self.max_char_pr_id = 0
 
+        # Header container nodes that receive generated charPr/paraPr/numbering
+        self._char_props_node = None
+        self._para_props_node = None
+        self._numberings_node = None
+
         self.images = [] # metadata for images
+        self._Image_cls = None  # PIL.Image, imported on first image that needs auto-sizing
+
+        # Image path validation results, so repeated references validate once
+        self._validated_image_paths = set()
+        self._rejected_image_paths = {}  # path -> SecurityError
 
         # Metadata extraction
         self.title = None
@@ -191,8 +232,7 @@ class MarkdownToHwpx:
         Raises:
             TemplateError: If template is corrupted or missing required files
         """
-        with open(reference_path, 'rb') as f:
-            ref_doc_bytes = f.read()
+        ref_doc_bytes = _load_template_bytes(reference_path)
 
         try:
             ref_zip = zipfile.ZipFile(io.BytesIO(ref_doc_bytes))
@@ -537,6 +577,15 @@ class MarkdownToHwpx:
                 if p_id > self.max_para_pr_id:
                      self.max_para_pr_id = p_id
 
+            self.max_num_id = 0
+            for num in root.findall('.//hh:numbering', self.namespaces):
+                n_id = int(num.get('id', 0))
+                if n_id > self.max_num_id:
+                    self.max_num_id = n_id
+
+            self._char_props_node = root.find('.//hh:charProperties', self.namespaces)
+            self._para_props_node = root.find('.//hh:paraProperties', self.namespaces)
+
             # --- Ensure Numbering Definitions ---
             self._init_numbering_structure(root)
 
@@ -593,7 +642,7 @@ class MarkdownToHwpx:
 
             # Combine
             detected_levels = []
-            self.outline_style_ids = {} # Initialize for usage in _handle_header
+            self.outline_style_ids = {} # Initialize for usage in _handle_header_elem
 
             for level, p_id in level_to_para_pr.items():
                 if p_id in para_pr_to_style_info:
@@ -1084,19 +1133,19 @@ class MarkdownToHwpx:
         new_header_xml = ""
         if self.header_root is not None:
              # Update itemCnt for charProperties
-             char_props = self.header_root.find('.//hh:charProperties', self.namespaces)
+             char_props = self._char_props_node
              if char_props is not None:
                  count = len(char_props.findall('hh:charPr', self.namespaces))
                  char_props.set('itemCnt', str(count))
 
              # Update itemCnt for paraProperties
-             para_props = self.header_root.find('.//hh:paraProperties', self.namespaces)
+             para_props = self._para_props_node
              if para_props is not None:
                  count = len(para_props.findall('hh:paraPr', self.namespaces))
                  para_props.set('itemCnt', str(count))
 
              # Update itemCnt for numberings
-             numberings = self.header_root.find('.//hh:numberings', self.namespaces)
+             numberings = self._numberings_node
              if numberings is not None:
                  count = len(numberings.findall('hh:numbering', self.namespaces))
                  numberings.set('itemCnt', str(count))
@@ -1112,10 +1161,15 @@ class MarkdownToHwpx:
         return xml_body, new_header_xml
 
     def _process_blocks(self, blocks):
+        """Process blocks and return the serialized section XML."""
+        return "\n".join(self._elem_to_str(elem) for elem in self._process_blocks_elems(blocks))
+
+    def _process_blocks_elems(self, blocks):
+        """Process blocks and return list of Elements (ElementTree version)."""
         result = []
         if not isinstance(blocks, list):
              logger.error("_process_blocks expected list, got %s: %s", type(blocks), blocks)
-             return ""
+             return result
 
         for block in blocks:
             if not isinstance(block, dict):
@@ -1126,31 +1180,32 @@ class MarkdownToHwpx:
             b_content = block.get('c')
 
             if b_type == 'Header':
-                result.append(self._handle_header(b_content))
+                result.append(self._handle_header_elem(b_content))
             elif b_type == 'Para':
-                result.append(self._handle_para(b_content))
+                result.append(self._handle_para_elem(b_content))
             elif b_type == 'Plain':
-                result.append(self._handle_plain(b_content))
+                result.append(self._handle_plain_elem(b_content))
             elif b_type == 'BulletList':
-                result.append(self._handle_bullet_list(b_content))
+                result.extend(self._handle_bullet_list_elem(b_content))
             elif b_type == 'OrderedList':
-                result.append(self._handle_ordered_list(b_content))
+                result.extend(self._handle_ordered_list_elem(b_content))
             elif b_type == 'CodeBlock':
-                result.append(self._handle_code_block(b_content))
+                result.append(self._handle_code_block_elem(b_content))
             elif b_type == 'Table':
-                result.append(self._handle_table(b_content))
+                elem = self._handle_table_elem(b_content)
+                if elem is not None:
+                    result.append(elem)
             elif b_type == 'BlockQuote':
-                result.append(self._handle_blockquote(b_content))
+                result.extend(self._handle_blockquote_elem(b_content))
             elif b_type == 'HorizontalRule':
-                result.append(self._handle_horizontal_rule())
+                result.extend(self._handle_horizontal_rule_elem())
             else:
                 # logger.warning("Unhandled Block Type: %s", b_type)
-                pass
+                continue
 
-            if result:
-                self._has_emitted_block = True
+            self._has_emitted_block = True
 
-        return "\n".join(result)
+        return result
 
     def _escape_text(self, text):
         """Escape text content for XML elements."""
@@ -1210,7 +1265,7 @@ class MarkdownToHwpx:
 
     # --- Block Handlers ---
 
-    def _handle_header(self, content):
+    def _handle_header_elem(self, content):
         level = content[0]
         inlines = content[2]
 
@@ -1246,11 +1301,11 @@ class MarkdownToHwpx:
 
             if mode == 'table':
                 # Header is inside a table in template - copy table structure
-                return self._handle_header_in_table(inlines, props, column_break_val,
+                return self._handle_header_in_table_elem(inlines, props, column_break_val,
                                                     counter=counter, page_break=page_break_val)
             else:
                 # Plain or prefix mode - use template styles
-                return self._handle_header_styled(inlines, props, column_break_val,
+                return self._handle_header_styled_elem(inlines, props, column_break_val,
                                                   counter=counter, page_break=page_break_val)
 
         # Fallback to existing style-based logic
@@ -1278,7 +1333,7 @@ class MarkdownToHwpx:
         para = self._create_para_elem(style_id=style_id, para_pr_id=para_pr_id,
                                       column_break=column_break_val, page_break=page_break_val)
         self._process_inlines_to_elems(inlines, para, base_char_pr_id=int(char_pr_id))
-        return self._elem_to_str(para)
+        return para
 
     def _format_counter_text(self, template_text, counter):
         """Format numbering text by replacing the pattern with the counter value.
@@ -1327,7 +1382,7 @@ class MarkdownToHwpx:
         # Fallback: return as-is
         return template_text
 
-    def _handle_header_in_table(self, inlines, props, column_break=0, counter=1, page_break=0):
+    def _handle_header_in_table_elem(self, inlines, props, column_break=0, counter=1, page_break=0):
         """Handle header that's defined inside a table in template.
 
         Copies the entire table structure and replaces the placeholder
@@ -1344,7 +1399,7 @@ class MarkdownToHwpx:
             counter: Occurrence number for auto-numbering (1-indexed)
 
         Returns:
-            XML string of the paragraph containing the table with header content
+            Paragraph Element containing the table with header content
         """
         table_elem = copy.deepcopy(props['table'])
 
@@ -1392,7 +1447,7 @@ class MarkdownToHwpx:
         self._add_elem(wrapper_run, NS_PARA, 't')
         wrapper_para.append(wrapper_run)
 
-        return self._elem_to_str(wrapper_para)
+        return wrapper_para
 
     def _find_parent(self, root, child):
         """Find the parent element of a child in an ElementTree."""
@@ -1436,7 +1491,7 @@ class MarkdownToHwpx:
         for child in elem.findall('hp:label', self.namespaces):
             elem.remove(child)
 
-    def _handle_header_styled(self, inlines, props, column_break=0, counter=1, page_break=0):
+    def _handle_header_styled_elem(self, inlines, props, column_break=0, counter=1, page_break=0):
         """Handle header with template styles (plain or prefix mode).
 
         Creates a paragraph with the template's styleIDRef, paraPrIDRef, and
@@ -1454,7 +1509,7 @@ class MarkdownToHwpx:
             counter: Occurrence number for auto-numbering the prefix (1-indexed)
 
         Returns:
-            XML string of the paragraph
+            Paragraph Element
         """
         char_pr_id = int(props['charPrIDRef'])
         para_pr_id = int(props['paraPrIDRef'])
@@ -1474,9 +1529,9 @@ class MarkdownToHwpx:
 
         # Add header content
         self._process_inlines_to_elems(inlines, para, base_char_pr_id=char_pr_id)
-        return self._elem_to_str(para)
+        return para
 
-    def _handle_text_block(self, content, placeholder_name='BODY'):
+    def _handle_text_block_elem(self, content, placeholder_name='BODY'):
         """Handle paragraph-like block (Para, Plain).
 
         Args:
@@ -1484,7 +1539,7 @@ class MarkdownToHwpx:
             placeholder_name: Name of placeholder style to use (default: 'BODY')
 
         Returns:
-            XML string of the paragraph
+            Paragraph Element
         """
         if placeholder_name in self.placeholder_styles:
             props = self.placeholder_styles[placeholder_name]
@@ -1502,15 +1557,15 @@ class MarkdownToHwpx:
 
         para = self._create_para_elem(style_id=self.normal_style_id, para_pr_id=para_pr_id)
         self._process_inlines_to_elems(content, para, base_char_pr_id=int(char_pr_id))
-        return self._elem_to_str(para)
+        return para
 
-    def _handle_para(self, content):
+    def _handle_para_elem(self, content):
         """Handle Para block."""
-        return self._handle_text_block(content, 'BODY')
+        return self._handle_text_block_elem(content, 'BODY')
 
-    def _handle_plain(self, content):
+    def _handle_plain_elem(self, content):
         """Handle Plain block."""
-        return self._handle_text_block(content, 'BODY')
+        return self._handle_text_block_elem(content, 'BODY')
 
     def _render_mermaid(self, code):
         """Render Mermaid code to a temporary PNG file via kroki.io (POST)."""
@@ -1536,7 +1591,7 @@ class MarkdownToHwpx:
             logger.error("Failed to render Mermaid diagram: %s", e)
         return None
 
-    def _handle_code_block(self, content):
+    def _handle_code_block_elem(self, content):
         # content = [[id, classes, attrs], code]
         attr = content[0]
         classes = attr[1]
@@ -1561,13 +1616,13 @@ class MarkdownToHwpx:
                 )
                 img_run = self._handle_image_elem(image_content)
                 para.append(img_run)
-                return self._elem_to_str(para)
+                return para
 
         # Default code block rendering (plain text)
         para = self._create_para_elem(style_id=self.normal_style_id, para_pr_id=self.normal_para_pr_id)
         run = self._create_text_run_elem(code)
         para.append(run)
-        return self._elem_to_str(para)
+        return para
 
     _PANDOC_ALIGN_MAP = {
         'AlignLeft': 'LEFT',
@@ -1623,7 +1678,7 @@ class MarkdownToHwpx:
             align_elem = ET.SubElement(new_node, f'{{{NS_HEAD}}}align')
         align_elem.set('horizontal', hwpx_align)
 
-        para_props = self.header_root.find('.//hh:paraProperties', self.namespaces)
+        para_props = self._para_props_node
         if para_props is not None:
             para_props.append(new_node)
 
@@ -1662,7 +1717,7 @@ class MarkdownToHwpx:
             original_val = int(left_node.get('value', 0))
             left_node.set('value', str(original_val + indent))
 
-        para_props = self.header_root.find('.//hh:paraProperties', self.namespaces)
+        para_props = self._para_props_node
         if para_props is not None:
             para_props.append(new_node)
 
@@ -1670,7 +1725,7 @@ class MarkdownToHwpx:
         self._blockquote_para_pr_cache[level] = new_id
         return new_id
 
-    def _handle_blockquote(self, content, level=0):
+    def _handle_blockquote_elem(self, content, level=0):
         """Handle block quote block.
 
         Block quotes are rendered as paragraphs with increased left margin.
@@ -1681,7 +1736,7 @@ class MarkdownToHwpx:
             level: Nesting level (0-based)
 
         Returns:
-            XML string of the block quote paragraphs
+            List of block quote paragraph Elements
         """
         if level >= self.config.MAX_NESTING_DEPTH:
             logger.warning("Block quote nesting depth limit reached (%d). Flattening.", self.config.MAX_NESTING_DEPTH)
@@ -1695,7 +1750,7 @@ class MarkdownToHwpx:
 
             if b_type == 'BlockQuote':
                 # Nested block quote
-                results.append(self._handle_blockquote(b_content, level=level + 1))
+                results.extend(self._handle_blockquote_elem(b_content, level=level + 1))
             elif b_type == 'Para' or b_type == 'Plain':
                 bq_para_pr = self._get_blockquote_para_pr(level)
                 para = self._create_para_elem(
@@ -1710,22 +1765,22 @@ class MarkdownToHwpx:
                     if style_node is not None:
                         normal_char_pr_id = int(style_node.get('charPrIDRef', 0))
                 self._process_inlines_to_elems(b_content, para, base_char_pr_id=normal_char_pr_id)
-                results.append(self._elem_to_str(para))
+                results.append(para)
             else:
                 # Other block types inside blockquote (lists, code, etc.)
-                results.append(self._process_blocks([block]))
+                results.extend(self._process_blocks_elems([block]))
 
-        return "\n".join(results)
+        return results
 
-    def _handle_horizontal_rule(self):
+    def _handle_horizontal_rule_elem(self):
         """Handle horizontal rule block.
 
         Renders as two empty paragraphs to create visual separation.
 
         Returns:
-            XML string of two empty paragraphs
+            List of two empty paragraph Elements
         """
-        result = ''
+        result = []
         for _ in range(2):
             para = self._create_para_elem(
                 style_id=self.normal_style_id,
@@ -1733,7 +1788,7 @@ class MarkdownToHwpx:
             )
             run = self._create_text_run_elem(" ")
             para.append(run)
-            result += self._elem_to_str(para)
+            result.append(para)
         return result
 
     def _get_row_type(self, row_idx, header_row_count, total_body_rows):
@@ -1909,12 +1964,14 @@ class MarkdownToHwpx:
             'bottom': str(self.config.TABLE_OUT_MARGIN_BOTTOM)
         })
         cell_margin = self.config.CELL_MARGIN_DEFAULT
-        self._add_elem(tbl, NS_PARA, 'inMargin', {
+        # Read-only; shared by every cell that has no placeholder margin
+        default_cell_margin = {
             'left': str(cell_margin['left']),
             'right': str(cell_margin['right']),
             'top': str(cell_margin['top']),
             'bottom': str(cell_margin['bottom'])
-        })
+        }
+        self._add_elem(tbl, NS_PARA, 'inMargin', default_cell_margin)
 
         # Generate Rows
         occupied_cells = set()
@@ -1963,13 +2020,7 @@ class MarkdownToHwpx:
                 border_fill_id = cell_style.get('borderFillIDRef', str(self.table_border_fill_id))
 
                 # Get cell margin from cell style or use defaults
-                default_margin = self.config.CELL_MARGIN_DEFAULT
-                cell_margin = cell_style.get('cellMargin', {
-                    'left': str(default_margin['left']),
-                    'right': str(default_margin['right']),
-                    'top': str(default_margin['top']),
-                    'bottom': str(default_margin['bottom'])
-                })
+                cell_margin = cell_style.get('cellMargin', default_cell_margin)
 
                 # Cell element
                 tc = self._add_elem(tr, NS_PARA, 'tc', {
@@ -2000,16 +2051,13 @@ class MarkdownToHwpx:
                 hwpx_align = self._pandoc_align_to_hwpx(cell_align)
 
                 # Process cell blocks and add to sublist
-                cell_content_xml = self._process_blocks(cell_blocks)
-                if cell_content_xml.strip():
-                    wrapper = f'<root xmlns:hp="{NS_PARA}" xmlns:hc="{NS_CORE}">{cell_content_xml}</root>'
-                    for elem in ET.fromstring(wrapper):
-                        # Apply alignment to paragraph elements
-                        if hwpx_align and elem.tag.endswith('}p'):
-                            aligned_pr = self._get_aligned_para_pr(hwpx_align)
-                            if aligned_pr:
-                                elem.set('paraPrIDRef', aligned_pr)
-                        sublist.append(elem)
+                for elem in self._process_blocks_elems(cell_blocks):
+                    # Apply alignment to paragraph elements
+                    if hwpx_align and elem.tag.endswith('}p'):
+                        aligned_pr = self._get_aligned_para_pr(hwpx_align)
+                        if aligned_pr:
+                            elem.set('paraPrIDRef', aligned_pr)
+                    sublist.append(elem)
 
                 # Cell properties
                 self._add_elem(tc, NS_PARA, 'cellAddr', {'colAddr': str(actual_col), 'rowAddr': str(curr_row_addr)})
@@ -2028,13 +2076,6 @@ class MarkdownToHwpx:
 
         return para
 
-    def _handle_table(self, content):
-        """Handle table block (legacy wrapper)."""
-        elem = self._handle_table_elem(content)
-        if elem is None:
-            return ""
-        return self._elem_to_str(elem)
-
     # --- INLINE PROCESSING & FORMATTING ---
 
     def _process_inlines(self, inlines, base_char_pr_id=0, active_formats=None):
@@ -2203,61 +2244,71 @@ class MarkdownToHwpx:
         attr = content[0]
         caption = content[1]  # list of inlines
         target = content[2]
+        config = self.config
 
         target_url = target[0]
 
-        # Validate image path against directory traversal
-        is_temp_file = os.path.isabs(target_url) and target_url.startswith(tempfile.gettempdir())
-        try:
-            if not is_temp_file:
-                self._validate_image_path(target_url, self.input_dir)
-        except SecurityError as e:
-            logger.warning("Skipping image with invalid path: %s", e)
-            return self._create_text_run_elem(f"[Image: {target_url}]", char_pr_id)
+        # Validate image path against directory traversal (once per distinct path)
+        if target_url not in self._validated_image_paths:
+            error = self._rejected_image_paths.get(target_url)
+            if error is None:
+                is_temp_file = os.path.isabs(target_url) and target_url.startswith(tempfile.gettempdir())
+                try:
+                    if not is_temp_file:
+                        self._validate_image_path(target_url, self.input_dir)
+                    self._validated_image_paths.add(target_url)
+                except SecurityError as e:
+                    error = self._rejected_image_paths[target_url] = e
+            if error is not None:
+                logger.warning("Skipping image with invalid path: %s", error)
+                return self._create_text_run_elem(f"[Image: {target_url}]", char_pr_id)
 
         # Validate image count limit
-        if len(self.images) >= self.config.MAX_IMAGE_COUNT:
+        max_images = config.MAX_IMAGE_COUNT
+        if len(self.images) >= max_images:
             logger.warning(
                 "Image count limit reached (%d). Skipping image: %s",
-                self.config.MAX_IMAGE_COUNT, target_url
+                max_images, target_url
             )
             return self._create_text_run_elem(f"[Image limit exceeded: {target_url}]", char_pr_id)
 
-        # Parse Attributes for Width/Height
-        attrs_map = dict(attr[2])
-
-        width_attr = attrs_map.get('width')
-        height_attr = attrs_map.get('height')
+        # Parse Attributes for Width/Height (usually 0-2 pairs, no dict needed)
+        width_attr = height_attr = None
+        for key, val in attr[2]:
+            if key == 'width':
+                width_attr = val
+            elif key == 'height':
+                height_attr = val
 
         # Default Size (from config)
-        width_hwp = self.config.IMAGE_DEFAULT_WIDTH
-        height_hwp = self.config.IMAGE_DEFAULT_HEIGHT
+        width_hwp = config.IMAGE_DEFAULT_WIDTH
+        height_hwp = config.IMAGE_DEFAULT_HEIGHT
 
         w_parsed = self._parse_dimension(width_attr)
         h_parsed = self._parse_dimension(height_attr)
 
         # --- Pillow Auto-Sizing & Max Width Logic ---
-        px_width = 0
-        px_height = 0
-
         if w_parsed and h_parsed:
-            width_hwp = w_parsed
-            height_hwp = h_parsed
-        elif w_parsed:
-            width_hwp = w_parsed
-
-        # If size missing or partial, try reading file
-        should_read_file = (not w_parsed) or (not h_parsed)
+            width_hwp, height_hwp = w_parsed, h_parsed
+        else:
+            # Size missing or partial: read pixel size from the file
+            if w_parsed:
+                width_hwp = w_parsed
+            elif h_parsed:
+                height_hwp = h_parsed
 
-        if should_read_file:
             image_found = False
+            if os.path.isabs(target_url) or not self.input_dir:
+                candidates = (target_url,)
+            else:
+                candidates = (target_url, os.path.join(self.input_dir, target_url))
             try:
-                candidates = [target_url]
-                if self.input_dir:
-                    candidates.append(os.path.join(self.input_dir, target_url))
-
                 for cand in candidates:
                     if os.path.exists(cand):
+                        Image = self._Image_cls
+                        if Image is None:
+                            from PIL import Image
+                            self._Image_cls = Image
                         with Image.open(cand) as im:
                             px_width, px_height = im.size
                             image_found = True
@@ -2266,23 +2317,18 @@ class MarkdownToHwpx:
                 pass
 
             if image_found:
-                LUNIT_PER_PX = self.config.LUNIT_PER_PX
-
-                calc_w = int(px_width * LUNIT_PER_PX)
-                calc_h = int(px_height * LUNIT_PER_PX)
-
-                if not w_parsed and not h_parsed:
-                    width_hwp = calc_w
-                    height_hwp = calc_h
-                elif w_parsed and not h_parsed:
-                    ratio = px_height / px_width
-                    height_hwp = int(w_parsed * ratio)
-                elif not w_parsed and h_parsed:
-                    ratio = px_width / px_height
-                    width_hwp = int(h_parsed * ratio)
+                # Derive the missing dimension(s) from the pixel aspect ratio
+                if w_parsed:
+                    height_hwp = int(w_parsed * (px_height / px_width))
+                elif h_parsed:
+                    width_hwp = int(h_parsed * (px_width / px_height))
+                else:
+                    LUNIT_PER_PX = config.LUNIT_PER_PX
+                    width_hwp = int(px_width * LUNIT_PER_PX)
+                    height_hwp = int(px_height * LUNIT_PER_PX)
 
         # --- Max Width Constraint (from config) ---
-        MAX_WIDTH_HWP = self.config.IMAGE_MAX_WIDTH
+        MAX_WIDTH_HWP = config.IMAGE_MAX_WIDTH
 
         if width_hwp > MAX_WIDTH_HWP:
             ratio = MAX_WIDTH_HWP / width_hwp
@@ -2470,13 +2516,7 @@ class MarkdownToHwpx:
         })
 
         # Process blocks and add to sublist
-        # Note: _process_blocks returns string, so we parse it back
-        body_xml = self._process_blocks(blocks)
-        if body_xml.strip():
-            # Wrap in root element for parsing
-            wrapper = f'<root xmlns:hp="{NS_PARA}" xmlns:hc="{NS_CORE}">{body_xml}</root>'
-            for elem in ET.fromstring(wrapper):
-                sublist.append(elem)
+        sublist.extend(self._process_blocks_elems(blocks))
 
         return run
 
@@ -2557,7 +2597,7 @@ class MarkdownToHwpx:
                 ET.SubElement(new_node, f'{{{NS_HEAD}}}subscript')
 
         # 4. Add to Header
-        char_props = self.header_root.find('.//hh:charProperties', self.namespaces)
+        char_props = self._char_props_node
         if char_props is not None:
             char_props.append(new_node)
 
@@ -2604,18 +2644,14 @@ class MarkdownToHwpx:
             # But XML standard requires order.
             # root is <hh:head>. Children: ...
             numberings_node = ET.SubElement(root, f'{{{NS_HEAD}}}numberings')
+        self._numberings_node = numberings_node
 
     def _create_numbering(self, type='ORDERED', start_num=1):
         # 1. Generate New ID
-        # Find max currently in header to be safe (since we append dynamically)
+        # IDs are only minted here, so the max found at header load stays current
         root = self.header_root
-        max_num_id = 0
-        for num in root.findall('.//hh:numbering', self.namespaces):
-            nid = int(num.get('id', 0))
-            if nid > max_num_id:
-                max_num_id = nid
-
-        new_id = str(max_num_id + 1)
+        self.max_num_id += 1
+        new_id = str(self.max_num_id)
 
         # 2. Get Template
         if type == 'ORDERED':
@@ -2637,19 +2673,22 @@ class MarkdownToHwpx:
         # Actually, paraHead 'start' controls the sequence reset?
         # No, hh:numbering start="X" is the main one.
 
-        numberings_node = root.find('.//hh:numberings', self.namespaces)
-        if numberings_node is None:
+        if self._numberings_node is None:
              self._init_numbering_structure(root)
-             numberings_node = root.find('.//hh:numberings', self.namespaces)
 
-        numberings_node.append(new_node)
+        self._numberings_node.append(new_node)
         return new_id
 
     def _get_list_para_pr(self, num_id, level):
+        hanging_val = self.config.LIST_HANGING_INDENT
+
         base_id = self.normal_para_pr_id
-        base_node = self.header_root.find(f'.//hh:paraPr[@id="{base_id}"]', self.namespaces)
+        base_node = self._list_base_para_pr
         if base_node is None:
-            return base_id
+            base_node = self.header_root.find(f'.//hh:paraPr[@id="{base_id}"]', self.namespaces)
+            if base_node is None:
+                return base_id
+            self._list_base_para_pr = base_node
 
         new_node = copy.deepcopy(base_node)
         self.max_para_pr_id += 1
@@ -2658,28 +2697,22 @@ class MarkdownToHwpx:
 
         heading = new_node.find('hh:heading', self.namespaces)
         if heading is None:
-            heading = ET.SubElement(new_node, f'{{{NS_HEAD}}}heading')
+            heading = ET.SubElement(new_node, _HH_HEADING)
         heading.set('type', 'NUMBER')
         heading.set('idRef', str(num_id))
         heading.set('level', str(level))
 
-        indent_per_level = self.config.LIST_INDENT_PER_LEVEL
-        current_indent = (level) * indent_per_level
-
-        for margin_node in new_node.findall('.//hc:left', self.namespaces):
-            original_val = int(margin_node.get('value', 0))
-            new_val = original_val + current_indent
-            margin_node.set('value', str(new_val))
-
-        hanging_val = self.config.LIST_HANGING_INDENT
-        for intent_node in new_node.findall('.//hc:intent', self.namespaces):
-            intent_node.set('value', str(-hanging_val))
-
-        for left_node in new_node.findall('.//hc:left', self.namespaces):
-            val = (level + 1) * hanging_val
-            left_node.set('value', str(val))
-
-        para_props = self.header_root.find('.//hh:paraProperties', self.namespaces)
+        # Single pass over the copied subtree: hanging first-line indent,
+        # left margin grows by one hanging step per level
+        left_val = str((level + 1) * hanging_val)
+        intent_val = str(-hanging_val)
+        for node in new_node.iter():
+            if node.tag == _HC_LEFT:
+                node.set('value', left_val)
+            elif node.tag == _HC_INTENT:
+                node.set('value', intent_val)
+
+        para_props = self._para_props_node
         if para_props is not None:
             para_props.append(new_node)
 
@@ -2687,117 +2720,15 @@ class MarkdownToHwpx:
 
     def _handle_bullet_list_elem(self, content, level=0):
         """Handle bullet list and return list of Elements (ElementTree version)."""
-        if level >= self.config.MAX_NESTING_DEPTH:
-            logger.warning("Bullet list nesting depth limit reached (%d). Flattening.", self.config.MAX_NESTING_DEPTH)
-            level = self.config.MAX_NESTING_DEPTH - 1
-
-        # Check if template defines style for this list level
-        list_key = ('BULLET', level + 1)  # Template uses 1-indexed levels
-
-        if list_key in self.list_styles:
-            style_info = self.list_styles[list_key]
-            mode = style_info.get('mode', 'prefix')
-
-            if mode == 'numbering':
-                # USE TEMPLATE NUMBERING
-                return self._handle_template_numbering_list_elem(content, 'BULLET', level)
-            else:
-                # USE PREFIX MODE
-                return self._handle_prefix_list_elem(content, 'BULLET', level)
-
-        # FALLBACK to existing auto-numbering (create new)
-        num_id = self._create_numbering('BULLET')
-
-        elements = []
-        for item_blocks in content:
-            for block in item_blocks:
-                b_type = block.get('t')
-                b_content = block.get('c')
-
-                list_para_pr = self._get_list_para_pr(num_id, level)
-
-                if b_type == 'Para' or b_type == 'Plain':
-                    para = self._create_para_elem(style_id=self.normal_style_id, para_pr_id=list_para_pr)
-                    self._process_inlines_to_elems(b_content, para)
-                    elements.append(para)
-                elif b_type == 'BulletList':
-                    elements.extend(self._handle_bullet_list_elem(b_content, level=level+1))
-                elif b_type == 'OrderedList':
-                    elements.extend(self._handle_ordered_list_elem(b_content, level=level+1))
-                else:
-                    # For other block types, use legacy processing
-                    block_xml = self._process_blocks([block])
-                    if block_xml.strip():
-                        wrapper = f'<root xmlns:hp="{NS_PARA}" xmlns:hc="{NS_CORE}">{block_xml}</root>'
-                        for elem in ET.fromstring(wrapper):
-                            elements.append(elem)
-
-        return elements
-
-    def _handle_bullet_list(self, content, level=0):
-        """Handle bullet list (legacy wrapper returning string)."""
-        elements = self._handle_bullet_list_elem(content, level)
-        return "\n".join(self._elem_to_str(elem) for elem in elements)
+        return self._walk_list(content, 'BULLET', level)
 
     def _handle_ordered_list_elem(self, content, level=0):
         """Handle ordered list and return list of Elements (ElementTree version)."""
-        if level >= self.config.MAX_NESTING_DEPTH:
-            logger.warning("Ordered list nesting depth limit reached (%d). Flattening.", self.config.MAX_NESTING_DEPTH)
-            level = self.config.MAX_NESTING_DEPTH - 1
-
         # content = [ [start, style, delim], [items] ]
         attrs = content[0]
         start_num = attrs[0]  # The start number
         items = content[1]
-
-        # Check if template defines style for this list level
-        list_key = ('ORDERED', level + 1)  # Template uses 1-indexed levels
-
-        if list_key in self.list_styles:
-            style_info = self.list_styles[list_key]
-            mode = style_info.get('mode', 'prefix')
-
-            if mode == 'numbering':
-                # USE TEMPLATE NUMBERING
-                return self._handle_template_numbering_list_elem(items, 'ORDERED', level)
-            else:
-                # USE PREFIX MODE
-                return self._handle_prefix_list_elem(items, 'ORDERED', level, start_num=start_num)
-
-        # FALLBACK to existing auto-numbering (create new)
-        num_id = self._create_numbering('ORDERED', start_num=start_num)
-
-        elements = []
-        for item_blocks in items:
-            for block in item_blocks:
-                b_type = block.get('t')
-                b_content = block.get('c')
-
-                list_para_pr = self._get_list_para_pr(num_id, level)
-
-                if b_type == 'Para' or b_type == 'Plain':
-                    para = self._create_para_elem(style_id=self.normal_style_id, para_pr_id=list_para_pr)
-                    self._process_inlines_to_elems(b_content, para)
-                    elements.append(para)
-                elif b_type == 'BulletList':
-                    elements.extend(self._handle_bullet_list_elem(b_content, level=level+1))
-                elif b_type == 'OrderedList':
-                    # Recursively handle nested ordered list
-                    elements.extend(self._handle_ordered_list_elem(b_content, level=level+1))
-                else:
-                    # For other block types, use legacy processing
-                    block_xml = self._process_blocks([block])
-                    if block_xml.strip():
-                        wrapper = f'<root xmlns:hp="{NS_PARA}" xmlns:hc="{NS_CORE}">{block_xml}</root>'
-                        for elem in ET.fromstring(wrapper):
-                            elements.append(elem)
-
-        return elements
-
-    def _handle_ordered_list(self, content, level=0):
-        """Handle ordered list (legacy wrapper returning string)."""
-        elements = self._handle_ordered_list_elem(content, level)
-        return "\n".join(self._elem_to_str(elem) for elem in elements)
+        return self._walk_list(items, 'ORDERED', level, start_num=start_num)
 
     def _format_list_prefix(self, prefix_template, list_type, counter):
         """Format list prefix, incrementing numbers/letters for ordered lists.
@@ -2818,113 +2749,132 @@ class MarkdownToHwpx:
 
         return self._format_counter_text(prefix_template, counter)
 
-    def _handle_prefix_list_elem(self, content, list_type, level=0, start_num=1):
-        """Handle list using prefix-based rendering (plain paragraphs with prefix text).
+    def _open_list_frame(self, items, list_type, level, start_num=1):
+        """Resolve how one (possibly nested) list is rendered.
+
+        Three modes, chosen per (list_type, level):
+        - 'numbering': template paraPr already references a numbering definition
+        - 'prefix': plain paragraphs with the template's prefix text
+        - 'auto': no template style, create a new hh:numbering for this list
 
         Args:
-            content: List items from AST
+            items: List items from AST (list of block lists)
             list_type: 'BULLET' or 'ORDERED'
             level: Nesting level (0-indexed)
             start_num: Starting number for ordered lists
 
         Returns:
-            List of paragraph Elements
+            dict describing the list, consumed by _walk_list
         """
-        elements = []
-        list_key = (list_type, level + 1)  # 1-indexed in template
-        style_info = self.list_styles.get(list_key, {})
-
-        prefix = style_info.get('prefix', '')
-        char_pr_id = int(style_info.get('charPrIDRef', 0))
-        para_pr_id = int(style_info.get('paraPrIDRef', self.normal_para_pr_id))
-
-        # For ordered lists, track counter to increment prefix numbers
-        item_counter = start_num
-
-        for item_blocks in content:
-            for block in item_blocks:
-                b_type = block.get('t')
-                b_content = block.get('c')
-
-                if b_type in ('Para', 'Plain'):
-                    # Create paragraph with template styles
-                    para = self._create_para_elem(
-                        style_id=self.normal_style_id,
-                        para_pr_id=para_pr_id
-                    )
+        max_depth = self.config.MAX_NESTING_DEPTH
+        if level >= max_depth:
+            logger.warning("%s list nesting depth limit reached (%d). Flattening.",
+                           list_type.capitalize(), max_depth)
+            level = max_depth - 1
+
+        frame = {
+            'blocks': (block for item_blocks in items for block in item_blocks),
+            'list_type': list_type,
+            'level': level,
+            'num_id': None,
+            'char_pr_id': 0,
+            'para_pr_id': None,
+            'prefix': None,
+            'counter': start_num,
+        }
 
-                    # Format prefix (increment numbers for ordered lists)
-                    current_prefix = self._format_list_prefix(prefix, list_type, item_counter)
+        # Check if template defines style for this list level
+        list_key = (list_type, level + 1)  # Template uses 1-indexed levels
+        style_info = self.list_styles.get(list_key)
+        if style_info is None:
+            # FALLBACK to existing auto-numbering (create new)
+            frame['num_id'] = self._create_numbering(list_type, start_num=start_num)
+            return frame
+
+        resolved = self._resolved_list_styles.get(list_key)
+        if resolved is None:
+            if style_info:
+                resolved = (
+                    int(style_info.get('charPrIDRef', 0)),
+                    int(style_info.get('paraPrIDRef', self.normal_para_pr_id)),
+                    None if style_info.get('mode', 'prefix') == 'numbering'
+                    else style_info.get('prefix', ''),
+                )
+            else:
+                # Empty placeholder info: defaults, prefix mode with no prefix
+                resolved = (0, int(self.normal_para_pr_id), '')
+            self._resolved_list_styles[list_key] = resolved
+        frame['char_pr_id'], frame['para_pr_id'], frame['prefix'] = resolved
+        return frame
+
+    # --- List item block handlers ---
+    # Signature: (frame, block, para_pr_id, stack, elements). Handlers append
+    # output to elements, or push a frame for a nested list onto stack.
+
+    def _emit_list_para(self, frame, block, para_pr_id, stack, elements):
+        """Para/Plain inside a list item: one paragraph, prefixed in prefix mode."""
+        para = self._create_para_elem(
+            style_id=self.normal_style_id,
+            para_pr_id=para_pr_id
+        )
+        char_pr_id = frame['char_pr_id']
 
-                    # Add prefix as first run
-                    if current_prefix:
-                        prefix_run = self._create_text_run_elem(current_prefix, char_pr_id)
-                        para.append(prefix_run)
+        # Prefix mode: add (incrementing) prefix as first run
+        if frame['prefix'] is not None:
+            current_prefix = self._format_list_prefix(
+                frame['prefix'], frame['list_type'], frame['counter'])
+            if current_prefix:
+                para.append(self._create_text_run_elem(current_prefix, char_pr_id))
+            frame['counter'] += 1
 
-                    # Add content
-                    self._process_inlines_to_elems(b_content, para, base_char_pr_id=char_pr_id)
-                    elements.append(para)
+        self._process_inlines_to_elems(block.get('c'), para, base_char_pr_id=char_pr_id)
+        elements.append(para)
 
-                    item_counter += 1
+    def _emit_list_bullet(self, frame, block, para_pr_id, stack, elements):
+        """Nested bullet list: continue the walk one level deeper."""
+        stack.append(self._open_list_frame(block.get('c'), 'BULLET', frame['level'] + 1))
 
-                elif b_type == 'BulletList':
-                    elements.extend(self._handle_bullet_list_elem(b_content, level=level+1))
-                elif b_type == 'OrderedList':
-                    elements.extend(self._handle_ordered_list_elem(b_content, level=level+1))
-                else:
-                    # Other block types - use existing processing
-                    block_xml = self._process_blocks([block])
-                    if block_xml.strip():
-                        wrapper = f'<root xmlns:hp="{NS_PARA}" xmlns:hc="{NS_CORE}">{block_xml}</root>'
-                        for elem in ET.fromstring(wrapper):
-                            elements.append(elem)
+    def _emit_list_ordered(self, frame, block, para_pr_id, stack, elements):
+        """Nested ordered list: continue the walk one level deeper."""
+        content = block.get('c')
+        stack.append(self._open_list_frame(
+            content[1], 'ORDERED', frame['level'] + 1, start_num=content[0][0]))
 
-        return elements
+    def _emit_list_fallback(self, frame, block, para_pr_id, stack, elements):
+        """Other block types (code, tables, quotes) render as usual."""
+        elements.extend(self._process_blocks_elems([block]))
 
-    def _handle_template_numbering_list_elem(self, content, list_type, level=0):
-        """Handle list using template's numbering definition.
+    def _walk_list(self, items, list_type, level=0, start_num=1):
+        """Render a list and all lists nested in it to paragraph Elements.
 
-        The template's paraPr already references the correct numbering style,
-        so we just use the paraPrIDRef directly.
+        Nested lists are pushed onto an explicit stack instead of recursing,
+        so output order matches a depth-first walk of the AST.
 
         Args:
-            content: List items from AST
+            items: List items from AST
             list_type: 'BULLET' or 'ORDERED'
             level: Nesting level (0-indexed)
+            start_num: Starting number for ordered lists
 
         Returns:
             List of paragraph Elements
         """
         elements = []
-        list_key = (list_type, level + 1)
-        style_info = self.list_styles.get(list_key, {})
-
-        char_pr_id = int(style_info.get('charPrIDRef', 0))
-        para_pr_id = int(style_info.get('paraPrIDRef', self.normal_para_pr_id))
-
-        for item_blocks in content:
-            for block in item_blocks:
-                b_type = block.get('t')
-                b_content = block.get('c')
-
-                if b_type in ('Para', 'Plain'):
-                    # Use template's paraPr (which has numbering reference)
-                    para = self._create_para_elem(
-                        style_id=self.normal_style_id,
-                        para_pr_id=para_pr_id
-                    )
-                    self._process_inlines_to_elems(b_content, para, base_char_pr_id=char_pr_id)
-                    elements.append(para)
+        stack = [self._open_list_frame(items, list_type, level, start_num)]
+        handlers = self._list_block_handlers
+        fallback = self._emit_list_fallback
+
+        while stack:
+            frame = stack[-1]
+            block = next(frame['blocks'], None)
+            if block is None:
+                stack.pop()
+                continue
 
-                elif b_type == 'BulletList':
-                    elements.extend(self._handle_bullet_list_elem(b_content, level=level+1))
-                elif b_type == 'OrderedList':
-                    elements.extend(self._handle_ordered_list_elem(b_content, level=level+1))
-                else:
-                    block_xml = self._process_blocks([block])
-                    if block_xml.strip():
-                        wrapper = f'<root xmlns:hp="{NS_PARA}" xmlns:hc="{NS_CORE}">{block_xml}</root>'
-                        for elem in ET.fromstring(wrapper):
-                            elements.append(elem)
+            para_pr_id = frame['para_pr_id']
+            if frame['num_id'] is not None:
+                para_pr_id = self._get_list_para_pr(frame['num_id'], frame['level'])
+
+            handlers.get(block.get('t'), fallback)(frame, block, para_pr_id, stack, elements)
 
         return elements
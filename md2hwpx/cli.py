@@ -14,6 +14,7 @@ from .frontmatter_parser import parse_markdown_with_frontmatter, convert_metadat
 from .marko_adapter import MarkoToPandocAdapter
 from .MarkdownToHtml import MarkdownToHtml
 from .MarkdownToHwpx import MarkdownToHwpx
+from .converter_api import _get_default_reference_doc
 from .exceptions import HwpxError, SecurityError
 from .config import DEFAULT_CONFIG
 
@@ -21,6 +22,13 @@ __version__ = "0.1.0"
 
 logger = logging.getLogger('md2hwpx')
 
+# Recognized file extensions (compared lowercased)
+_MD_EXTS = frozenset({'.md', '.markdown'})
+_HTML_EXTS = frozenset({'.htm', '.html'})
+
+# Stream handler installed by setup_logging (created on first use)
+_log_handler = None
+
 
 def setup_logging(verbose=False, quiet=False):
     """Configure logging based on CLI flags.
@@ -36,21 +44,29 @@ def setup_logging(verbose=False, quiet=False):
     else:
         level = logging.INFO
 
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
     root_logger = logging.getLogger('md2hwpx')
     root_logger.setLevel(level)
-    root_logger.addHandler(handler)
 
+    # Repeat calls (e.g. main() invoked in a loop) reuse the first handler
+    global _log_handler
+    if _log_handler is None:
+        _log_handler = logging.StreamHandler(sys.stderr)
+        _log_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    if _log_handler not in root_logger.handlers:
+        root_logger.addHandler(_log_handler)
+    # Our handler already prints; don't echo records via the root logger too
+    root_logger.propagate = False
 
-def main():
+
+def _build_parser():
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         prog="md2hwpx",
         description="Convert Markdown to HWPX format (Pandoc-free).",
         epilog="Examples:\n"
                "  md2hwpx input.md -o output.hwpx\n"
                "  md2hwpx input.md --reference-doc=custom.hwpx -o output.hwpx\n"
-               "  md2hwpx input.md -o debug.json\n"
+               "  md2hwpx input.md -o debug.json --pretty\n"
                "  md2hwpx input.md -o output.hwpx --verbose",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -65,8 +81,16 @@ def main():
                         help="Show detailed debug output")
     parser.add_argument("-q", "--quiet", action="store_true", default=False,
                         help="Suppress all non-error output")
+    parser.add_argument("--pretty", action="store_true", default=False,
+                        help="Indent .json debug output (default: compact)")
+    return parser
+
+
+_PARSER = _build_parser()
 
-    args = parser.parse_args()
+
+def main():
+    args = _PARSER.parse_args()
 
     # Set up logging
     setup_logging(verbose=args.verbose, quiet=args.quiet)
@@ -75,16 +99,18 @@ def main():
 
     # Validate input is Markdown
     input_ext = os.path.splitext(input_file)[1].lower()
-    if input_ext not in ['.md', '.markdown']:
+    if input_ext not in _MD_EXTS:
         logger.error("Only Markdown files are supported. Got: %s", input_ext)
         sys.exit(1)
 
-    if not os.path.exists(input_file):
+    # One stat call covers both the existence and the size check
+    try:
+        input_size = os.stat(input_file).st_size
+    except OSError:
         logger.error("Input file not found: %s", input_file)
         sys.exit(1)
 
     # Validate input file size
-    input_size = os.path.getsize(input_file)
     if input_size > DEFAULT_CONFIG.MAX_INPUT_FILE_SIZE:
         logger.error(
             "Input file too large: %d bytes (max %d bytes)",
@@ -97,11 +123,11 @@ def main():
     # Determine Reference Doc
     ref_doc = args.reference_doc
     if not ref_doc and output_ext == ".hwpx":
-        pkg_dir = os.path.dirname(os.path.abspath(__file__))
-        default_ref = os.path.join(pkg_dir, "blank.hwpx")
-        if os.path.exists(default_ref):
+        default_ref = _get_default_reference_doc()
+        try:
+            os.stat(default_ref)
             ref_doc = default_ref
-        else:
+        except OSError:
             logger.error("--reference-doc is required and no default 'blank.hwpx' found in package.")
             sys.exit(1)
 
@@ -112,21 +138,25 @@ def main():
     adapter = MarkoToPandocAdapter()
     ast = adapter.parse(md_content)
 
-    # Inject metadata into AST
-    ast['meta'] = convert_metadata_to_pandoc_meta(metadata)
-
     try:
+        # Inject metadata into AST (the adapter already provides an empty 'meta')
+        if metadata:
+            ast['meta'] = convert_metadata_to_pandoc_meta(metadata)
+
         if output_ext == ".hwpx":
             MarkdownToHwpx.convert_to_hwpx(input_file, args.output, ref_doc, json_ast=ast)
             logger.info("Successfully converted to %s", args.output)
 
         elif output_ext == ".json":
-            # Debug: output the converted AST
+            # Debug: output the converted AST (compact unless --pretty)
             with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(ast, f, indent=2, ensure_ascii=False)
+                if args.pretty:
+                    json.dump(ast, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(ast, f, separators=(',', ':'), ensure_ascii=False)
             logger.info("Successfully wrote AST to %s", args.output)
 
-        elif output_ext in [".htm", ".html"]:
+        elif output_ext in _HTML_EXTS:
             # Hidden feature: HTML output for debugging
             MarkdownToHtml.convert_to_html(input_file, args.output, json_ast=ast)
             logger.info("Successfully converted to %s", args.output)
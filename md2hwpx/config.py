@@ -5,72 +5,146 @@ This module centralizes all magic numbers and default values used throughout
 the conversion process. Values can be overridden by:
 1. Placeholder styles extracted from reference template
 2. CLI arguments (future)
+
+ConversionConfig is immutable; override values at construction time, e.g.
+``ConversionConfig(TABLE_WIDTH=50000)`` or ``dataclasses.replace(cfg, ...)``.
+Subclasses that override defaults (``class C(ConversionConfig): TABLE_WIDTH =
+50000``) are turned into frozen dataclasses automatically, so do not decorate
+them with ``@dataclass`` yourself.
 """
 
+from collections.abc import Mapping as _MappingABC
+from dataclasses import dataclass, fields
+from typing import Mapping, Tuple
+
+_LUNIT_PER_MM = 283.465
+
+
+class _FrozenMap(_MappingABC):
+    """Read-only, hashable mapping used for dict-valued config fields."""
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, data):
+        self._data = dict(data)
+        self._hash = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def _freeze(value):
+    """Return an immutable equivalent of a dict or list config value."""
+    if isinstance(value, _FrozenMap):
+        return value
+    if isinstance(value, _MappingABC):
+        return _FrozenMap(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
 
+@dataclass(frozen=True)
 class ConversionConfig:
     """Default configuration values for HWPX conversion."""
 
     # === Unit Conversion ===
-    LUNIT_PER_MM = 283.465  # HWP logical units per millimeter
-    LUNIT_PER_PX = (25.4 * 283.465) / 96.0  # Logical units per pixel (96 DPI)
+    LUNIT_PER_MM: float = _LUNIT_PER_MM  # HWP logical units per millimeter
+    LUNIT_PER_PX: float = (25.4 * _LUNIT_PER_MM) / 96.0  # Logical units per pixel (96 DPI)
 
     # === Table Layout ===
-    TABLE_WIDTH = 45000  # Default table width in logical units (~159mm)
-    TABLE_OUT_MARGIN_BOTTOM = 1417  # Bottom margin after table
+    TABLE_WIDTH: int = 45000  # Default table width in logical units (~159mm)
+    TABLE_OUT_MARGIN_BOTTOM: int = 1417  # Bottom margin after table
 
     # === Cell Margins (default padding inside cells) ===
-    CELL_MARGIN_DEFAULT = {
+    CELL_MARGIN_DEFAULT: Mapping[str, int] = _FrozenMap({
         'left': 510,
         'right': 510,
         'top': 141,
         'bottom': 141
-    }
+    })
 
     # === Table Borders ===
-    TABLE_BORDER_TYPE = 'SOLID'
-    TABLE_BORDER_WIDTH = '0.12 mm'
-    TABLE_BORDER_COLOR = '#000000'
+    TABLE_BORDER_TYPE: str = 'SOLID'
+    TABLE_BORDER_WIDTH: str = '0.12 mm'
+    TABLE_BORDER_COLOR: str = '#000000'
 
     # === Table Cell Styling ===
-    TABLE_CELL_BG_COLOR = 'none'
-    TABLE_HEADER_BG_COLOR = 'none'
+    TABLE_CELL_BG_COLOR: str = 'none'
+    TABLE_HEADER_BG_COLOR: str = 'none'
 
     # === List Indentation ===
-    LIST_INDENT_PER_LEVEL = 2000  # Indentation per nesting level
-    LIST_HANGING_INDENT = 2000  # Hanging indent for list items
+    LIST_INDENT_PER_LEVEL: int = 2000  # Indentation per nesting level
+    LIST_HANGING_INDENT: int = 2000  # Hanging indent for list items
 
     # Bullet characters for different levels (Korean style)
-    LIST_BULLET_CHARS = ['ㅇ', '-', '∙', '●', '○', '■', '●']
+    LIST_BULLET_CHARS: Tuple[str, ...] = ('ㅇ', '-', '∙', '●', '○', '■', '●')
 
     # === Image Settings ===
-    IMAGE_MAX_WIDTH_MM = 150  # Maximum image width in mm
-    IMAGE_MAX_WIDTH = int(150 * LUNIT_PER_MM)  # ~42520 logical units
-    IMAGE_DEFAULT_WIDTH = 8504  # Default width (~30mm)
-    IMAGE_DEFAULT_HEIGHT = 8504  # Default height (~30mm)
+    IMAGE_MAX_WIDTH_MM: int = 150  # Maximum image width in mm
+    IMAGE_MAX_WIDTH: int = int(150 * _LUNIT_PER_MM)  # ~42520 logical units
+    IMAGE_DEFAULT_WIDTH: int = 8504  # Default width (~30mm)
+    IMAGE_DEFAULT_HEIGHT: int = 8504  # Default height (~30mm)
 
     # === Block Quote ===
-    BLOCKQUOTE_LEFT_INDENT = 2000  # Left margin indent for block quotes
-    BLOCKQUOTE_INDENT_PER_LEVEL = 2000  # Additional indent per nesting level
+    BLOCKQUOTE_LEFT_INDENT: int = 2000  # Left margin indent for block quotes
+    BLOCKQUOTE_INDENT_PER_LEVEL: int = 2000  # Additional indent per nesting level
 
     # === Page Break ===
-    PAGE_BREAK_BEFORE_H1 = True  # Insert page break before H1 when not first block
+    PAGE_BREAK_BEFORE_H1: bool = True  # Insert page break before H1 when not first block
 
     # === Link Styling ===
-    LINK_COLOR = '#0000FF'  # Blue
-    LINK_UNDERLINE = True
+    LINK_COLOR: str = '#0000FF'  # Blue
+    LINK_UNDERLINE: bool = True
 
     # === Character/Paragraph Property IDs ===
     # These are typically extracted from template, but defaults are provided
-    DEFAULT_CHAR_PR_ID = 0
-    DEFAULT_PARA_PR_ID = 0
-    DEFAULT_STYLE_ID = 0
+    DEFAULT_CHAR_PR_ID: int = 0
+    DEFAULT_PARA_PR_ID: int = 0
+    DEFAULT_STYLE_ID: int = 0
 
     # === Security Limits ===
-    MAX_INPUT_FILE_SIZE = 50 * 1024 * 1024  # 50 MB max input file
-    MAX_TEMPLATE_FILE_SIZE = 50 * 1024 * 1024  # 50 MB max template file
-    MAX_NESTING_DEPTH = 20  # Max recursion for nested lists/quotes
-    MAX_IMAGE_COUNT = 500  # Max number of images in a single document
+    MAX_INPUT_FILE_SIZE: int = 50 * 1024 * 1024  # 50 MB max input file
+    MAX_TEMPLATE_FILE_SIZE: int = 50 * 1024 * 1024  # 50 MB max template file
+    MAX_NESTING_DEPTH: int = 20  # Max recursion for nested lists/quotes
+    MAX_IMAGE_COUNT: int = 500  # Max number of images in a single document
+
+    def __post_init__(self):
+        # Keep instances hashable and read-only when a dict or list is passed in
+        for f in fields(self):
+            value = getattr(self, f.name)
+            frozen = _freeze(value)
+            if frozen is not value:
+                object.__setattr__(self, f.name, frozen)
+
+    def __init_subclass__(cls, **kwargs):
+        # A plain class attribute on a subclass would be shadowed by the
+        # inherited __init__ (C().TABLE_WIDTH would still be the base value),
+        # so make every subclass a dataclass with its overrides as defaults.
+        super().__init_subclass__(**kwargs)
+        annotations = cls.__dict__.get('__annotations__')
+        if annotations is None:
+            annotations = {}
+            cls.__annotations__ = annotations
+        for f in fields(ConversionConfig):
+            if f.name in cls.__dict__:
+                setattr(cls, f.name, _freeze(cls.__dict__[f.name]))
+                annotations.setdefault(f.name, f.type)
+        dataclass(frozen=True)(cls)
 
 
 # Global default config instance
@@ -13,10 +13,13 @@ from .MarkdownToHwpx import MarkdownToHwpx
 from .config import ConversionConfig, DEFAULT_CONFIG
 
 
+# Resolved once at import; the package location does not change at runtime
+_DEFAULT_REFERENCE_DOC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blank.hwpx")
+
+
 def _get_default_reference_doc():
     """Return path to the built-in blank.hwpx template."""
-    pkg_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(pkg_dir, "blank.hwpx")
+    return _DEFAULT_REFERENCE_DOC
 
 
 def convert_string(markdown_string, output_path, reference_doc=None, config=None):
@@ -42,7 +45,8 @@ def convert_string(markdown_string, output_path, reference_doc=None, config=None
     # Convert to Pandoc-like AST
     adapter = MarkoToPandocAdapter()
     ast = adapter.parse(md_content)
-    ast['meta'] = convert_metadata_to_pandoc_meta(metadata)
+    if metadata:
+        ast['meta'] = convert_metadata_to_pandoc_meta(metadata)
 
     # Convert AST to HWPX file (no input_path since source is a string)
     MarkdownToHwpx.convert_to_hwpx(
@@ -4,6 +4,11 @@ YAML front matter parser using python-frontmatter.
 
 import frontmatter
 
+from .exceptions import ConversionError
+
+# Space used between words of metadata values; shared, so never mutated
+_SPACE = {"t": "Space"}
+
 
 def parse_markdown_with_frontmatter(file_path: str) -> tuple[dict, str]:
     """
@@ -15,8 +20,18 @@ def parse_markdown_with_frontmatter(file_path: str) -> tuple[dict, str]:
     Returns:
         (metadata_dict, markdown_content_without_frontmatter)
     """
-    post = frontmatter.load(file_path)
-    return dict(post.metadata), post.content
+    with open(file_path, 'rb') as f:
+        text = f.read().decode('utf-8')
+
+    # python-frontmatter normalizes newlines and strips the text before it
+    # asks its loaded handlers (YAML, JSON, and TOML when installed) to
+    # detect a delimiter. When none matches, skip the parser and return the
+    # same normalized content it would.
+    stripped = text.replace('\r\n', '\n').strip()
+    if frontmatter.detect_format(stripped, frontmatter.handlers) is None:
+        return {}, stripped
+
+    return parse_markdown_string_with_frontmatter(text)
 
 
 def parse_markdown_string_with_frontmatter(markdown_text: str) -> tuple[dict, str]:
@@ -30,7 +45,8 @@ def parse_markdown_string_with_frontmatter(markdown_text: str) -> tuple[dict, st
         (metadata_dict, markdown_content_without_frontmatter)
     """
     post = frontmatter.loads(markdown_text)
-    return dict(post.metadata), post.content
+    # post.metadata is already a fresh plain dict owned by this Post
+    return post.metadata, post.content
 
 
 def convert_metadata_to_pandoc_meta(metadata: dict) -> dict:
@@ -44,80 +60,125 @@ def convert_metadata_to_pandoc_meta(metadata: dict) -> dict:
         metadata: Dictionary of metadata from front matter
 
     Returns:
-        Pandoc-compatible meta dictionary
+        Pandoc-compatible meta dictionary (all Space inlines are one shared
+        dict: replace them rather than mutate them)
+
+    Raises:
+        ConversionError: If a mapping contains itself (recursive YAML anchor)
     """
+    if not metadata:
+        return {}
+
     pandoc_meta = {}
 
-    for key, value in metadata.items():
-        if isinstance(value, str):
-            # Simple string -> MetaInlines (split by spaces)
-            inlines = _text_to_inlines(value)
-            pandoc_meta[key] = {
-                "t": "MetaInlines",
-                "c": inlines
-            }
-        elif isinstance(value, list):
-            # List -> MetaList
-            items = []
-            for v in value:
-                inlines = _text_to_inlines(str(v))
-                items.append({
-                    "t": "MetaInlines",
-                    "c": inlines
-                })
-            pandoc_meta[key] = {
-                "t": "MetaList",
-                "c": items
-            }
-        elif isinstance(value, dict):
-            # Dict -> MetaMap (recursive)
-            pandoc_meta[key] = {
-                "t": "MetaMap",
-                "c": convert_metadata_to_pandoc_meta(value)
-            }
-        elif isinstance(value, bool):
-            # Boolean -> MetaBool
-            pandoc_meta[key] = {
-                "t": "MetaBool",
-                "c": value
-            }
-        elif isinstance(value, (int, float)):
-            # Number -> MetaInlines (as string)
-            pandoc_meta[key] = {
-                "t": "MetaInlines",
-                "c": [{"t": "Str", "c": str(value)}]
-            }
-        else:
-            # Fallback: convert to string
-            inlines = _text_to_inlines(str(value))
-            pandoc_meta[key] = {
-                "t": "MetaInlines",
-                "c": inlines
-            }
+    # Nested dicts (MetaMap) are expanded from an explicit stack rather than
+    # by recursion; each entry pairs a source dict with its output dict and
+    # the ids of the dicts on its path (YAML anchors can make a dict contain
+    # itself, which would otherwise expand forever).
+    stack = [(metadata, pandoc_meta, frozenset((id(metadata),)))]
+    while stack:
+        source, target, path = stack.pop()
+        for key, value in source.items():
+            convert = _META_CONVERTERS.get(type(value))
+            if convert is None:
+                if isinstance(value, dict):
+                    if id(value) in path:
+                        raise ConversionError(
+                            f"Front matter key '{key}' refers to a mapping that contains it")
+                    # Dict -> MetaMap, filled in when popped from the stack
+                    child = {}
+                    target[key] = {
+                        "t": "MetaMap",
+                        "c": child
+                    }
+                    stack.append((value, child, path | {id(value)}))
+                    continue
+                convert = _meta_converter_for(type(value))
+            target[key] = convert(value)
 
     return pandoc_meta
 
 
+def _meta_inlines(value: str) -> dict:
+    """Simple string -> MetaInlines (split by spaces)."""
+    return {
+        "t": "MetaInlines",
+        "c": _text_to_inlines(value)
+    }
+
+
+def _meta_list(value: list) -> dict:
+    """List -> MetaList (str() only for non-string items)."""
+    return {
+        "t": "MetaList",
+        "c": [
+            {"t": "MetaInlines", "c": _text_to_inlines(v if type(v) is str else str(v))}
+            for v in value
+        ]
+    }
+
+
+def _meta_bool(value: bool) -> dict:
+    """Boolean -> MetaBool."""
+    return {
+        "t": "MetaBool",
+        "c": value
+    }
+
+
+def _meta_number(value) -> dict:
+    """Number -> MetaInlines (as string)."""
+    return {
+        "t": "MetaInlines",
+        "c": [{"t": "Str", "c": str(value)}]
+    }
+
+
+def _meta_fallback(value) -> dict:
+    """Fallback: convert to string."""
+    return _meta_inlines(str(value))
+
+
+# Exact-type dispatch; bool gets its own entry so it never reaches int
+_META_CONVERTERS = {
+    str: _meta_inlines,
+    list: _meta_list,
+    bool: _meta_bool,
+    int: _meta_number,
+    float: _meta_number,
+}
+
+
+def _meta_converter_for(value_type: type):
+    """Find the converter for a subclass of a dispatched type (or the fallback)."""
+    for base in value_type.__mro__:
+        convert = _META_CONVERTERS.get(base)
+        if convert is not None:
+            return convert
+    return _meta_fallback
+
+
 def _text_to_inlines(text: str) -> list:
     """
     Convert a text string to Pandoc inline elements (Str and Space).
 
+    Runs of whitespace collapse to a single Space, as in Pandoc; leading and
+    trailing whitespace is dropped.
+
     Args:
         text: Plain text string
 
     Returns:
         List of Pandoc inline elements
     """
-    if not text:
+    words = text.split()
+    if not words:
         return []
 
-    result = []
-    words = text.split(' ')
-
-    for i, word in enumerate(words):
-        if word:
-            result.append({"t": "Str", "c": word})
-        if i < len(words) - 1:
-            result.append({"t": "Space"})
+    result = [{"t": "Str", "c": words[0]}]
+    append = result.append
+    for word in words[1:]:
+        append(_SPACE)
+        append({"t": "Str", "c": word})
 
     return result
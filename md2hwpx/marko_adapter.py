@@ -1,8 +1,55 @@
 from __future__ import annotations
+import functools
+import json
 import re
 from typing import Union
 from marko import Markdown
-from marko.ext.gfm import GFM
+
+# Every word break in converted text refers to this one dict. The HWPX/HTML
+# writers only read the AST; callers that edit it must replace Space nodes
+# rather than mutate them (see MarkoToPandocAdapter.parse).
+_SPACE_TOKEN = {"t": "Space"}
+
+# Word splits of raw text shorter than this are memoized (short phrases repeat
+# a lot); the Str dicts themselves are always built per call
+_RAW_TEXT_CACHE_MAX_LEN = 64
+
+
+def _tokenize_raw_text(text: str) -> list:
+    """Split raw text into Str and Space tokens."""
+    # Single word (no space): one C-level scan, no split/loop needed
+    if ' ' not in text:
+        return [{"t": "Str", "c": text}]
+
+    # Split by spaces but keep track of leading/trailing spaces:
+    # every boundary between parts is one Space, empty parts add no Str
+    parts = text.split(' ')
+    first = parts[0]
+    result = [{"t": "Str", "c": first}] if first else []
+    append = result.append
+    for part in parts[1:]:
+        append(_SPACE_TOKEN)
+        if part:
+            append({"t": "Str", "c": part})
+
+    return result
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_short_raw_text(text: str) -> tuple:
+    """Words of raw text with None for each Space (immutable, so safe to cache)."""
+    return tuple(None if token is _SPACE_TOKEN else token["c"]
+                 for token in _tokenize_raw_text(text))
+
+
+def _tokenize(text: str) -> list:
+    """Str and Space tokens for raw text as a new list of new Str dicts."""
+    if not text:
+        return []
+    if ' ' not in text or len(text) >= _RAW_TEXT_CACHE_MAX_LEN:
+        return _tokenize_raw_text(text)
+    return [_SPACE_TOKEN if word is None else {"t": "Str", "c": word}
+            for word in _split_short_raw_text(text)]
 
 
 class MarkoToPandocAdapter:
@@ -10,37 +57,106 @@ class MarkoToPandocAdapter:
 
     # Regex to match extended headers (7-9 levels)
     # Standard Markdown only supports 1-6, but HWPX supports up to 9
-    EXTENDED_HEADER_RE = re.compile(r'^(#{7,9})\s+(.+)$')
+    # (a trailing \r from CRLF input is not part of the header text)
+    EXTENDED_HEADER_RE = re.compile(r'^(#{7,9})\s+(.+?)\r?$')
 
     # Regex to match table separator lines (e.g., |---|-----------|---|)
     TABLE_SEPARATOR_RE = re.compile(r'^\|[\s:]*-')
 
+    # Regex to match one separator cell (e.g., ---, :---, ---:, :---:)
+    CELL_DASH_RE = re.compile(r'^:?-+:?$')
+
     def __init__(self):
         # Initialize Marko with GFM (tables, strikethrough, etc.) and Footnote support
         # Extensions are loaded by name string
         self.md = Markdown(extensions=['gfm', 'footnote'])
         self.footnotes = {}  # Store footnote definitions from document
+        self._footnote_cache = {}  # Converted footnote blocks by label
         self.extended_headers = {}  # Store extended header placeholders
         self.table_dash_counts = {}  # Store dash counts per table separator
         self.table_counter = 0  # Track table index during conversion
 
-    def _preprocess_extended_headers(self, markdown_text: str) -> str:
+        # Marko element class name -> converter. Block types not listed
+        # (BlankLine, LinkRefDef, FootnoteDef, unknown) are skipped; link
+        # references are resolved during parsing and footnote content is
+        # handled via FootnoteRef.
+        self._block_dispatch = {
+            'Heading': self._convert_heading,
+            'SetextHeading': self._convert_heading,
+            'Paragraph': self._convert_paragraph,
+            'List': self._convert_list,
+            'FencedCode': self._convert_fenced_code,
+            'CodeBlock': self._convert_code_block,
+            'Table': self._convert_table,
+            'Quote': self._convert_blockquote,
+            'ThematicBreak': self._convert_thematic_break,
+            'HTMLBlock': self._convert_raw_block,
+        }
+        self._inline_dispatch = {
+            'RawText': self._convert_raw_text_elem,
+            'Emphasis': self._convert_emphasis,
+            'StrongEmphasis': self._convert_strong_emphasis,
+            'Link': self._convert_link,
+            'Image': self._convert_image,
+            'CodeSpan': self._convert_code_span,
+            'LineBreak': self._convert_line_break,
+            'SoftBreak': self._convert_soft_break,
+            'Strikethrough': self._convert_strikethrough,
+            'InlineHTML': self._convert_inline_html,
+            'AutoLink': self._convert_auto_link,
+            'Literal': self._convert_literal,
+            'FootnoteRef': self._convert_footnote_ref,
+        }
+        # Container blocks whose children are expanded by _convert_blocks
+        self._container_dispatch = {
+            'List': self._open_list,
+            'Quote': self._open_blockquote,
+        }
+        # Element class -> converter (or None), filled from the name tables on
+        # first sight of each class. Keying by class skips a __name__ lookup
+        # and string hash per node, and still covers the subclasses that
+        # extensions (gfm, footnote) substitute for the core elements.
+        self._block_by_class = {}
+        self._inline_by_class = {}
+        self._container_by_class = {}
+
+    def _preprocess(self, markdown_text: str) -> str:
         """
-        Preprocess markdown to handle header levels 7-9.
+        Prepare markdown for Marko in a single pass over its lines.
+
+        Extended headers (levels 7-9): standard Markdown only supports
+        levels 1-6, so ####### lines become unique placeholders, restored
+        as Header blocks after Marko parsing. Each placeholder is wrapped
+        with blank lines to ensure it becomes its own paragraph block (not
+        merged with adjacent text).
 
-        Standard Markdown only supports levels 1-6.
-        We convert ####### lines to unique placeholders, then restore
-        them as Header blocks after Marko parsing.
+        Table separators: the number of dashes in each column of every
+        separator row is recorded in self.table_dash_counts (keyed by table
+        order) and later used to calculate proportional column widths.
 
-        Each placeholder is wrapped with blank lines to ensure it becomes
-        its own paragraph block (not merged with adjacent text).
+        Args:
+            markdown_text: Raw markdown string
+
+        Returns:
+            Markdown text with extended headers replaced by placeholders
         """
-        lines = markdown_text.split('\n')
+        # Neither an extended header nor a table is possible: nothing to do
+        if '#######' not in markdown_text and '|' not in markdown_text:
+            return markdown_text
+
         processed_lines = []
+        append = processed_lines.append
         placeholder_counter = 0
+        table_index = 0
+        header_match = self.EXTENDED_HEADER_RE.match
+        separator_match = self.TABLE_SEPARATOR_RE.match
+        cell_dash_match = self.CELL_DASH_RE.match
 
-        for line in lines:
-            match = self.EXTENDED_HEADER_RE.match(line)
+        # split('\n') rather than splitlines(): it is faster on this input and
+        # only breaks where Marko does (splitlines also splits on \x0c,
+        # \u2028, ... which would shift placeholders and table rows)
+        for line in markdown_text.split('\n'):
+            match = header_match(line)
             if match:
                 hashes = match.group(1)
                 content = match.group(2)
@@ -54,42 +170,19 @@ class MarkoToPandocAdapter:
                     'content': content
                 }
                 # Add blank lines around placeholder to ensure it's a separate paragraph
-                processed_lines.append('')
-                processed_lines.append(placeholder)
-                processed_lines.append('')
+                append('')
+                append(placeholder)
+                append('')
                 placeholder_counter += 1
-            else:
-                processed_lines.append(line)
-
-        return '\n'.join(processed_lines)
-
-    def _create_extended_header_block(self, level: int, content: str) -> dict:
-        """Create a Header block for extended levels (7-9)."""
-        # Parse the content as inline markdown
-        inlines = self._convert_raw_text(content)
-        return {
-            "t": "Header",
-            "c": [level, ["", [], []], inlines]
-        }
-
-    def _preprocess_table_dashes(self, markdown_text):
-        """Extract dash counts from table separator rows before Marko parsing.
+                continue
 
-        Scans the raw markdown for table separator lines and records
-        the number of dashes in each column. This is used later to
-        calculate proportional column widths.
+            append(line)
 
-        Args:
-            markdown_text: Raw markdown string
-        """
-        self.table_dash_counts = {}
-        table_index = 0
-        for line in markdown_text.split('\n'):
             stripped = line.strip()
-            if not self.TABLE_SEPARATOR_RE.match(stripped):
+            if not separator_match(stripped):
                 continue
             cells = [c.strip() for c in stripped.split('|')[1:-1]]
-            if cells and all(re.match(r'^:?-+:?$', c) for c in cells if c):
+            if cells and all(cell_dash_match(c) for c in cells if c):
                 dash_counts = {}
                 for col_idx, cell in enumerate(cells):
                     if cell:
@@ -97,6 +190,17 @@ class MarkoToPandocAdapter:
                 self.table_dash_counts[table_index] = dash_counts
                 table_index += 1
 
+        return '\n'.join(processed_lines)
+
+    def _create_extended_header_block(self, level: int, content: str) -> dict:
+        """Create a Header block for extended levels (7-9)."""
+        # Parse the content as inline markdown
+        inlines = self._convert_raw_text(content)
+        return {
+            "t": "Header",
+            "c": [level, ["", [], []], inlines]
+        }
+
     def _get_col_width_info(self, table_index, col_idx):
         """Get width info dict for a column from stored dash counts.
 
@@ -121,20 +225,70 @@ class MarkoToPandocAdapter:
         """
         Parse markdown and return Pandoc-like AST dict.
 
+        The returned tree is the caller's to edit, except that every
+        ``{"t": "Space"}`` inline is one shared dict: replace Space nodes
+        instead of mutating them.
+
         Returns:
             {"pandoc-api-version": [...], "meta": {...}, "blocks": [...]}
         """
+        doc = self._parse_document(markdown_text)
+
+        blocks = self._convert_blocks(doc.children)
+        if self.extended_headers:
+            # Swap extended header placeholders back to Header blocks
+            blocks = [self._restore_extended_header(block) for block in blocks]
+
+        return {
+            "pandoc-api-version": [1, 23, 1],  # Compatibility marker
+            "meta": {},  # Metadata handled separately by python-frontmatter
+            "blocks": blocks
+        }
+
+    def parse_to_json(self, markdown_text: str, out) -> None:
+        """
+        Parse markdown and write the Pandoc-like AST as JSON to a text stream.
+
+        Writes the same document as ``json.dump(self.parse(markdown_text), out,
+        ensure_ascii=False)``, but serializes each top-level block as soon as
+        it is converted, so the dict tree for the whole document is never
+        held in memory at once.
+
+        Args:
+            markdown_text: Markdown source (without front matter)
+            out: Writable text file object
+        """
+        doc = self._parse_document(markdown_text)
+        restore = self._restore_extended_header if self.extended_headers else None
+        write = out.write
+
+        write('{"pandoc-api-version": [1, 23, 1], "meta": {}, "blocks": [')
+        separator = ''
+        for child in doc.children:
+            for block in self._convert_blocks((child,)):
+                if restore is not None:
+                    block = restore(block)
+                write(separator)
+                write(json.dumps(block, ensure_ascii=False))
+                separator = ', '
+        write(']}')
+
+    def _parse_document(self, markdown_text: str):
+        """Reset per-document state, preprocess, and run Marko.
+
+        Returns:
+            Marko Document whose children are ready for _convert_blocks
+        """
         # Reset state for each parse
         self.extended_headers = {}
         self.footnotes = {}
+        self._footnote_cache = {}
         self.table_dash_counts = {}
         self.table_counter = 0
 
-        # Preprocess to handle extended headers (7-9)
-        processed_text = self._preprocess_extended_headers(markdown_text)
-
-        # Extract table dash counts for proportional column widths
-        self._preprocess_table_dashes(markdown_text)
+        # Replace extended headers (7-9) with placeholders and extract
+        # table dash counts for proportional column widths
+        processed_text = self._preprocess(markdown_text)
 
         doc = self.md.parse(processed_text)
 
@@ -142,28 +296,16 @@ class MarkoToPandocAdapter:
         if hasattr(doc, 'footnotes'):
             self.footnotes = doc.footnotes
 
-        blocks = []
-        for child in doc.children:
-            block = self._convert_block(child)
-            if block:
-                # Check if this is an extended header placeholder
-                block = self._restore_extended_header(block)
-                blocks.append(block)
-
-        return {
-            "pandoc-api-version": [1, 23, 1],  # Compatibility marker
-            "meta": {},  # Metadata handled separately by python-frontmatter
-            "blocks": blocks
-        }
+        return doc
 
     def _restore_extended_header(self, block: dict) -> dict:
         """
         Check if a block is an extended header placeholder and restore it.
 
         Extended header placeholders become paragraphs with text like
-        "__EXTENDED_HEADER_0__", which we convert back to Header blocks.
+        "EXTHEADER0MARKER", which we convert back to Header blocks.
         """
-        if block.get('t') != 'Para':
+        if not self.extended_headers or block.get('t') != 'Para':
             return block
 
         inlines = block.get('c', [])
@@ -181,40 +323,61 @@ class MarkoToPandocAdapter:
 
         return block
 
+    def _convert_blocks(self, children) -> list:
+        """Convert a sequence of Marko blocks, including nested lists/quotes.
+
+        Containers are expanded from an explicit stack instead of recursing,
+        so deep nesting cannot hit the recursion limit. Children are still
+        converted in document order (tables are numbered in that order).
+        Each stack entry pairs an iterator of Marko children with the list
+        that receives their converted blocks.
+        """
+        result = []
+        stack = [(iter(children), result)]
+        container_by_class = self._container_by_class
+        container_dispatch = self._container_dispatch
+        convert_block = self._convert_block
+
+        while stack:
+            children_iter, target = stack[-1]
+            element = next(children_iter, None)
+            if element is None:
+                stack.pop()
+                continue
+
+            cls = type(element)
+            try:
+                open_container = container_by_class[cls]
+            except KeyError:
+                open_container = container_by_class[cls] = container_dispatch.get(cls.__name__)
+
+            if open_container is None:
+                block = convert_block(element)
+                if block:
+                    target.append(block)
+                continue
+
+            # Container: emit its (empty) block now, fill it from the stack
+            block, child_frames = open_container(element)
+            target.append(block)
+            stack.extend(
+                (iter(grandchildren), child_target)
+                for grandchildren, child_target in reversed(child_frames)
+            )
+
+        return result
+
     def _convert_block(self, element) -> Union[dict, None]:
         """Convert a Marko block element to Pandoc dict format."""
-        elem_type = type(element).__name__
-
-        if elem_type == 'Heading':
-            return self._convert_heading(element)
-        elif elem_type == 'Paragraph':
-            return self._convert_paragraph(element)
-        elif elem_type == 'List':
-            return self._convert_list(element)
-        elif elem_type == 'FencedCode':
-            return self._convert_fenced_code(element)
-        elif elem_type == 'CodeBlock':
-            return self._convert_code_block(element)
-        elif elem_type == 'Table':
-            return self._convert_table(element)
-        elif elem_type == 'Quote':
-            return self._convert_blockquote(element)
-        elif elem_type == 'ThematicBreak':
-            return {"t": "HorizontalRule"}
-        elif elem_type == 'BlankLine':
-            return None  # Skip blank lines
-        elif elem_type == 'HTMLBlock':
-            return self._convert_raw_block(element)
-        elif elem_type == 'LinkRefDef':
-            return None  # Skip link reference definitions (handled during parsing)
-        elif elem_type == 'SetextHeading':
-            return self._convert_heading(element)
-        elif elem_type == 'FootnoteDef':
-            return None  # Skip - footnote content is handled via FootnoteRef
-
-        # Unknown block type - skip with warning
-        # print(f"[Warn] Unknown block type: {elem_type}")
-        return None
+        cls = type(element)
+        try:
+            convert = self._block_by_class[cls]
+        except KeyError:
+            convert = self._block_by_class[cls] = self._block_dispatch.get(cls.__name__)
+        if convert is None:
+            # Skipped or unknown block type
+            return None
+        return convert(element)
 
     def _convert_heading(self, elem) -> dict:
         """Heading -> {"t": "Header", "c": [level, [id, [], []], inlines]}"""
@@ -232,35 +395,36 @@ class MarkoToPandocAdapter:
 
     def _convert_list(self, elem) -> dict:
         """List -> BulletList or OrderedList"""
-        items = []
-        for item in elem.children:
-            item_blocks = []
-            for child in item.children:
-                block = self._convert_block(child)
-                if block:
-                    item_blocks.append(block)
-            items.append(item_blocks)
+        return self._convert_blocks((elem,))[0]
+
+    def _open_list(self, elem) -> tuple:
+        """List shell for _convert_blocks: (block, [(item children, item blocks)])"""
+        children = elem.children
+        items = [[] for _ in children]
 
         ordered = getattr(elem, 'ordered', False)
         if ordered:
             # OrderedList: [[start, style, delim], items]
             start = getattr(elem, 'start', 1) or 1
-            return {
+            block = {
                 "t": "OrderedList",
                 "c": [[start, {"t": "Decimal"}, {"t": "Period"}], items]
             }
         else:
-            return {"t": "BulletList", "c": items}
+            block = {"t": "BulletList", "c": items}
+        return block, [(item.children, item_blocks) for item, item_blocks in zip(children, items)]
+
+    def _convert_thematic_break(self, elem) -> dict:
+        """ThematicBreak -> {"t": "HorizontalRule"}"""
+        return {"t": "HorizontalRule"}
 
     def _convert_fenced_code(self, elem) -> dict:
         """FencedCode -> {"t": "CodeBlock", "c": [[id, classes, attrs], code]}"""
         lang = getattr(elem, 'lang', '') or ''
-        code = ''
-        for child in elem.children:
-            if hasattr(child, 'children'):
-                code += child.children
-            else:
-                code += str(child)
+        code = ''.join(
+            child.children if hasattr(child, 'children') else str(child)
+            for child in elem.children
+        )
         return {
             "t": "CodeBlock",
             "c": [["", [lang] if lang else [], []], code]
@@ -268,12 +432,10 @@ class MarkoToPandocAdapter:
 
     def _convert_code_block(self, elem) -> dict:
         """CodeBlock (indented) -> {"t": "CodeBlock", "c": [[id, [], []], code]}"""
-        code = ''
-        for child in elem.children:
-            if hasattr(child, 'children'):
-                code += child.children
-            else:
-                code += str(child)
+        code = ''.join(
+            child.children if hasattr(child, 'children') else str(child)
+            for child in elem.children
+        )
         return {
             "t": "CodeBlock",
             "c": [["", [], []], code]
@@ -328,21 +490,22 @@ class MarkoToPandocAdapter:
 
         specs = []
         if first_row and first_row.children:
+            align_get = self._ALIGN_MAP.get
+            get_width = self._get_col_width_info
             for col_idx, cell in enumerate(first_row.children):
-                cell_align = getattr(cell, 'align', None)
-                align_str = self._ALIGN_MAP.get(cell_align, 'AlignDefault')
-                width_info = self._get_col_width_info(table_idx, col_idx)
-                specs.append([align_str, width_info])
+                align_str = align_get(getattr(cell, 'align', None), 'AlignDefault')
+                specs.append([align_str, get_width(table_idx, col_idx)])
         else:
             specs = [["AlignDefault", self._get_col_width_info(table_idx, i)]
                      for i in range(col_count)]
 
         # Convert header
-        head_converted = [self._convert_table_row(row) for row in head_rows]
+        convert_row = self._convert_table_row
+        head_converted = [convert_row(row) for row in head_rows]
         head = [["", [], []], head_converted]
 
         # Convert body
-        body_converted = [self._convert_table_row(r) for r in body_rows]
+        body_converted = [convert_row(r) for r in body_rows]
         bodies = [[["", [], []], 0, [], body_converted]] if body_converted else []
 
         # Foot (GFM doesn't have)
@@ -363,30 +526,29 @@ class MarkoToPandocAdapter:
     def _convert_table_row(self, row) -> list:
         """Convert TableRow to Pandoc row format."""
         # Pandoc row: [attr, [cells]]
-        cells = []
-        for cell in row.children:
-            # Pandoc cell: [attr, align, rowspan, colspan, [blocks]]
-            content = self._convert_children_to_inlines(cell.children)
-            para = {"t": "Plain", "c": content}
-            cell_align = getattr(cell, 'align', None)
-            align_str = self._ALIGN_MAP.get(cell_align, 'AlignDefault')
-            cells.append([
+        # Pandoc cell: [attr, align, rowspan, colspan, [blocks]]
+        to_inlines = self._convert_children_to_inlines
+        align_get = self._ALIGN_MAP.get
+        cells = [
+            [
                 ["", [], []],   # attr
-                align_str,      # align
+                align_get(getattr(cell, 'align', None), 'AlignDefault'),  # align
                 1,              # rowspan (GFM doesn't support)
                 1,              # colspan (GFM doesn't support)
-                [para]          # blocks
-            ])
+                [{"t": "Plain", "c": to_inlines(cell.children)}]  # blocks
+            ]
+            for cell in row.children
+        ]
         return [["", [], []], cells]
 
     def _convert_blockquote(self, elem) -> dict:
         """Quote -> {"t": "BlockQuote", "c": [blocks]}"""
+        return self._convert_blocks((elem,))[0]
+
+    def _open_blockquote(self, elem) -> tuple:
+        """Quote shell for _convert_blocks: (block, [(children, blocks)])"""
         blocks = []
-        for child in elem.children:
-            block = self._convert_block(child)
-            if block:
-                blocks.append(block)
-        return {"t": "BlockQuote", "c": blocks}
+        return {"t": "BlockQuote", "c": blocks}, [(elem.children, blocks)]
 
     def _convert_raw_block(self, elem) -> dict:
         """HTMLBlock -> {"t": "RawBlock", "c": ["html", content]}"""
@@ -395,62 +557,33 @@ class MarkoToPandocAdapter:
 
     def _convert_children_to_inlines(self, children) -> list:
         """Convert Marko inline children to Pandoc inline list."""
-        if children is None:
+        if not children:
             return []
 
+        # Known classes dispatch straight from the class cache; anything else
+        # (first sight of a class, str, unknown) goes through _convert_inline
+        by_class = self._inline_by_class
         result = []
+        append = result.append
+        extend = result.extend
         for child in children:
-            inlines = self._convert_inline(child)
-            if isinstance(inlines, list):
-                result.extend(inlines)
+            convert = by_class.get(type(child))
+            inlines = convert(child) if convert is not None else self._convert_inline(child)
+            if type(inlines) is list:
+                extend(inlines)
             elif inlines:
-                result.append(inlines)
+                append(inlines)
         return result
 
     def _convert_inline(self, elem):
         """Convert a Marko inline element to Pandoc inline dict."""
-        elem_type = type(elem).__name__
-
-        if elem_type == 'RawText':
-            return self._convert_raw_text(elem.children)
-        elif elem_type == 'Emphasis':
-            inlines = self._convert_children_to_inlines(elem.children)
-            return {"t": "Emph", "c": inlines}
-        elif elem_type == 'StrongEmphasis':
-            inlines = self._convert_children_to_inlines(elem.children)
-            return {"t": "Strong", "c": inlines}
-        elif elem_type == 'Link':
-            inlines = self._convert_children_to_inlines(elem.children)
-            dest = getattr(elem, 'dest', '')
-            title = getattr(elem, 'title', '') or ''
-            return {"t": "Link", "c": [["", [], []], inlines, [dest, title]]}
-        elif elem_type == 'Image':
-            inlines = self._convert_children_to_inlines(elem.children)
-            dest = getattr(elem, 'dest', '')
-            title = getattr(elem, 'title', '') or ''
-            return {"t": "Image", "c": [["", [], []], inlines, [dest, title]]}
-        elif elem_type == 'CodeSpan':
-            code = getattr(elem, 'children', '')
-            return {"t": "Code", "c": [["", [], []], code]}
-        elif elem_type == 'LineBreak':
-            return {"t": "LineBreak"}
-        elif elem_type == 'SoftBreak':
-            return {"t": "SoftBreak"}
-        elif elem_type == 'Strikethrough':
-            inlines = self._convert_children_to_inlines(elem.children)
-            return {"t": "Strikeout", "c": inlines}
-        elif elem_type == 'InlineHTML':
-            content = getattr(elem, 'children', '')
-            return {"t": "RawInline", "c": ["html", content]}
-        elif elem_type == 'AutoLink':
-            dest = getattr(elem, 'dest', '')
-            return {"t": "Link", "c": [["", [], []], [{"t": "Str", "c": dest}], [dest, ""]]}
-        elif elem_type == 'Literal':
-            text = getattr(elem, 'children', '')
-            return self._convert_raw_text(text)
-        elif elem_type == 'FootnoteRef':
-            # Convert footnote reference to Pandoc Note
-            return self._convert_footnote_ref(elem)
+        cls = type(elem)
+        try:
+            convert = self._inline_by_class[cls]
+        except KeyError:
+            convert = self._inline_by_class[cls] = self._inline_dispatch.get(cls.__name__)
+        if convert is not None:
+            return convert(elem)
 
         # Handle string children (e.g., from RawText)
         if isinstance(elem, str):
@@ -465,22 +598,74 @@ class MarkoToPandocAdapter:
 
         return None
 
-    def _convert_raw_text(self, text: str) -> list:
-        """Convert raw text to Str and Space tokens."""
-        if not text:
-            return []
+    def _convert_raw_text_elem(self, elem) -> list:
+        """RawText -> Str and Space tokens (calls _tokenize directly, skipping
+        _convert_raw_text, since RawText is by far the most common inline)"""
+        return _tokenize(elem.children)
+
+    def _convert_emphasis(self, elem) -> dict:
+        """Emphasis -> {"t": "Emph", "c": inlines}"""
+        children = elem.children
+        inlines = self._convert_children_to_inlines(children) if children else []
+        return {"t": "Emph", "c": inlines}
+
+    def _convert_strong_emphasis(self, elem) -> dict:
+        """StrongEmphasis -> {"t": "Strong", "c": inlines}"""
+        children = elem.children
+        inlines = self._convert_children_to_inlines(children) if children else []
+        return {"t": "Strong", "c": inlines}
+
+    def _convert_link(self, elem) -> dict:
+        """Link -> {"t": "Link", "c": [attr, inlines, [dest, title]]}"""
+        inlines = self._convert_children_to_inlines(elem.children)
+        dest = getattr(elem, 'dest', '')
+        title = getattr(elem, 'title', '') or ''
+        return {"t": "Link", "c": [["", [], []], inlines, [dest, title]]}
 
-        result = []
-        # Split by spaces but keep track of leading/trailing spaces
-        parts = text.split(' ')
+    def _convert_image(self, elem) -> dict:
+        """Image -> {"t": "Image", "c": [attr, inlines, [dest, title]]}"""
+        inlines = self._convert_children_to_inlines(elem.children)
+        dest = getattr(elem, 'dest', '')
+        title = getattr(elem, 'title', '') or ''
+        return {"t": "Image", "c": [["", [], []], inlines, [dest, title]]}
+
+    def _convert_code_span(self, elem) -> dict:
+        """CodeSpan -> {"t": "Code", "c": [attr, code]}"""
+        code = getattr(elem, 'children', '')
+        return {"t": "Code", "c": [["", [], []], code]}
+
+    def _convert_line_break(self, elem) -> dict:
+        """LineBreak -> {"t": "LineBreak"}"""
+        return {"t": "LineBreak"}
+
+    def _convert_soft_break(self, elem) -> dict:
+        """SoftBreak -> {"t": "SoftBreak"}"""
+        return {"t": "SoftBreak"}
+
+    def _convert_strikethrough(self, elem) -> dict:
+        """Strikethrough -> {"t": "Strikeout", "c": inlines}"""
+        children = elem.children
+        inlines = self._convert_children_to_inlines(children) if children else []
+        return {"t": "Strikeout", "c": inlines}
+
+    def _convert_inline_html(self, elem) -> dict:
+        """InlineHTML -> {"t": "RawInline", "c": ["html", content]}"""
+        content = getattr(elem, 'children', '')
+        return {"t": "RawInline", "c": ["html", content]}
 
-        for i, part in enumerate(parts):
-            if part:
-                result.append({"t": "Str", "c": part})
-            if i < len(parts) - 1:
-                result.append({"t": "Space"})
+    def _convert_auto_link(self, elem) -> dict:
+        """AutoLink -> Link whose text is the destination"""
+        dest = getattr(elem, 'dest', '')
+        return {"t": "Link", "c": [["", [], []], [{"t": "Str", "c": dest}], [dest, ""]]}
 
-        return result
+    def _convert_literal(self, elem) -> list:
+        """Literal (backslash escape) -> Str and Space tokens"""
+        text = getattr(elem, 'children', '')
+        return self._convert_raw_text(text)
+
+    def _convert_raw_text(self, text: str) -> list:
+        """Convert raw text to Str and Space tokens."""
+        return _tokenize(text)
 
     def _convert_footnote_ref(self, elem) -> dict:
         """Convert FootnoteRef to Pandoc Note format."""
@@ -489,18 +674,21 @@ class MarkoToPandocAdapter:
         if not label:
             return None
 
-        # Look up the footnote definition (keys are lowercase)
-        footnote_def = self.footnotes.get(label.lower())
+        # Repeated references share the blocks converted the first time
+        blocks = self._footnote_cache.get(label)
+        if blocks is not None:
+            return {"t": "Note", "c": blocks}
+
+        # Look up the footnote definition. Marko normalizes (casefolds) both
+        # definition keys and reference labels, so the label is the key.
+        footnote_def = self.footnotes.get(label)
         if not footnote_def:
             # Footnote not found - return the reference as plain text
             return {"t": "Str", "c": f"[^{label}]"}
 
         # Convert footnote content to blocks
-        blocks = []
-        for child in footnote_def.children:
-            block = self._convert_block(child)
-            if block:
-                blocks.append(block)
+        blocks = self._convert_blocks(footnote_def.children)
+        self._footnote_cache[label] = blocks
 
         # Pandoc Note format: {"t": "Note", "c": [blocks]}
         return {"t": "Note", "c": blocks}
@@ -0,0 +1,36 @@
+"""
+Tests for md2hwpx.config.
+
+Run from the repository root: python -m unittest discover -s tests
+"""
+
+import unittest
+
+from md2hwpx.config import ConversionConfig, DEFAULT_CONFIG
+
+
+class ConversionConfigTests(unittest.TestCase):
+
+    def test_subclass_override_applies(self):
+        class Wide(ConversionConfig):
+            TABLE_WIDTH = 50000
+
+        self.assertEqual(Wide().TABLE_WIDTH, 50000)
+        self.assertEqual(Wide(TABLE_WIDTH=1).TABLE_WIDTH, 1)
+
+    def test_cell_margin_default_on_class(self):
+        self.assertEqual(ConversionConfig.CELL_MARGIN_DEFAULT['left'], 510)
+
+    def test_dict_override_stays_hashable(self):
+        margin = {'left': 0, 'right': 0, 'top': 0, 'bottom': 0}
+        config = ConversionConfig(CELL_MARGIN_DEFAULT=margin)
+        margin['left'] = 99
+
+        self.assertEqual(config.CELL_MARGIN_DEFAULT['left'], 0)
+        self.assertEqual(hash(config),
+                         hash(ConversionConfig(CELL_MARGIN_DEFAULT=dict(config.CELL_MARGIN_DEFAULT))))
+        self.assertNotEqual(config, DEFAULT_CONFIG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Tests for md2hwpx.frontmatter_parser.
+
+Run from the repository root: python -m unittest discover -s tests
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+import frontmatter
+from frontmatter.default_handlers import YAMLHandler
+
+from md2hwpx.exceptions import ConversionError
+from md2hwpx.frontmatter_parser import (
+    convert_metadata_to_pandoc_meta,
+    parse_markdown_string_with_frontmatter,
+    parse_markdown_with_frontmatter,
+)
+
+
+class ParseFileTests(unittest.TestCase):
+
+    def _parse(self, text):
+        with tempfile.NamedTemporaryFile('wb', suffix='.md', delete=False) as f:
+            f.write(text.encode('utf-8'))
+        try:
+            return parse_markdown_with_frontmatter(f.name)
+        finally:
+            os.unlink(f.name)
+
+    def test_no_front_matter(self):
+        self.assertEqual(self._parse("\n# Title\r\n\nBody\n"), ({}, "# Title\n\nBody"))
+
+    def test_uses_loaded_handlers(self):
+        # Stands in for TOMLHandler ('+++'), which is only loaded with toml
+        plus = YAMLHandler(re.compile(r'^\+{3,}\s*$', re.MULTILINE), '+++', '+++')
+        with mock.patch.object(frontmatter, 'handlers', frontmatter.handlers + [plus]):
+            metadata, content = self._parse("+++\ntitle: T\n+++\n\nBody")
+        self.assertEqual(metadata, {'title': 'T'})
+        self.assertEqual(content, "Body")
+
+
+class ConvertMetadataTests(unittest.TestCase):
+
+    def test_recursive_anchor_raises(self):
+        metadata, _ = parse_markdown_string_with_frontmatter(
+            "---\na: &x {b: *x}\n---\n\nBody")
+        with self.assertRaises(ConversionError):
+            convert_metadata_to_pandoc_meta(metadata)
+
+    def test_shared_mapping_is_not_recursive(self):
+        shared = {'x': 'y'}
+        meta = convert_metadata_to_pandoc_meta({'a': shared, 'b': shared})
+        self.assertEqual(meta['a'], meta['b'])
+        self.assertEqual(meta['a']['t'], 'MetaMap')
+
+    def test_str_edit_does_not_leak(self):
+        first = convert_metadata_to_pandoc_meta({'title': 'Doc Title'})
+        first['title']['c'][0]['c'] = 'changed'
+
+        second = convert_metadata_to_pandoc_meta({'title': 'Doc Title'})
+        self.assertEqual(second['title']['c'][0], {"t": "Str", "c": "Doc"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Tests for md2hwpx.marko_adapter.
+
+Run from the repository root: python -m unittest discover -s tests
+"""
+
+import unittest
+
+from md2hwpx.marko_adapter import MarkoToPandocAdapter
+
+
+TABLE_MD = "# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+
+
+class AstIsolationTests(unittest.TestCase):
+    """Editing one returned AST must not leak into later parses."""
+
+    def test_attr_edit_does_not_leak(self):
+        first = MarkoToPandocAdapter().parse(TABLE_MD)
+        first['blocks'][0]['c'][1][0] = 'intro'
+        first['blocks'][0]['c'][1][1].append('cls')
+
+        second = MarkoToPandocAdapter().parse(TABLE_MD)
+        self.assertEqual(second['blocks'][0]['c'][1], ["", [], []])
+        table = second['blocks'][1]['c']
+        self.assertEqual(table[0], ["", [], []])
+        row = table[3][1][0]
+        self.assertEqual(row[0], ["", [], []])
+        self.assertEqual(row[1][0][0], ["", [], []])
+
+    def test_str_edit_does_not_leak(self):
+        first = MarkoToPandocAdapter().parse("hello world\n")
+        first['blocks'][0]['c'][0]['c'] = 'changed'
+
+        second = MarkoToPandocAdapter().parse("hello world\n")
+        self.assertEqual(second['blocks'][0]['c'][0], {"t": "Str", "c": "hello"})
+
+
+if __name__ == '__main__':
+    unittest.main()